@@ -1,12 +1,10 @@
 #!/usr/bin/env python3
 """Own NZXT Fan Control GUI application."""
 
-import json
 import os
 import re
 import socket
 import sys
-import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, override
@@ -40,6 +38,7 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
+from requests.adapters import HTTPAdapter
 from src.layouts.device import DeviceSection
 from src.layouts.temp import TemperatureSection
 from src.utils.device_manager import DeviceManager
@@ -75,50 +74,70 @@ class Worker(QThread):
         self.__min_temp: float = min_temp
         self.__config: ServerConfiguration = config
         self.__temp_source: dict[str, str] = temp_source
-        s: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        self.__local_ip: str = s.getsockname()[0]
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            self.__local_ip: str = s.getsockname()[0]
         self.__config.ip = self.__local_ip
         self.__cpu: DeviceInfo = DeviceInfo(name="CPU", temp=self.__min_temp, pattern="(Intel|AMD)")
         self.__gpu: DeviceInfo = DeviceInfo(name="GPU", temp=self.__min_temp, pattern="(NVIDIA)")
+        self.__patterns: dict[str, re.Pattern[str]] = {
+            device.name: re.compile(device.pattern) for device in (self.__cpu, self.__gpu)
+        }
+        self.__hardware_index: dict[str, int] = {}
+        self.__session: requests.Session = requests.Session()
+        self.__session.headers["Connection"] = "keep-alive"
+        self.__session.trust_env = False
+        self.__session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
 
     def __get_info_from_server(self) -> dict[str, Any]:
         """Get sensors information from the server."""
         response: requests.Response|None = None
-        for _ in range(3):
+        for attempt in range(3):
             try:
-                response = requests.get(f"http://{self.__config.ip}:{self.__config.port}/data.json")
-            except requests.exceptions.ConnectionError:
-                self.sleep(1)
+                response = self.__session.get(self.__config.url, timeout=(0.5, 1.5))
+                break
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                self.msleep(200 * 2 ** attempt)
         if response and response.ok:
-            return response.json()
+            try:
+                return utils.load_json(response.content)
+            except ValueError:
+                pass
         return {}
 
-    def __parse_info(self, hardware: dict[str, Any], is_cpu: bool=True) -> bool:
-        """Parse sensor information."""
-        device: DeviceInfo = self.__cpu if is_cpu else self.__gpu
-        if re.search(device.pattern, hardware["Text"]):
-            for sensor in hardware["Children"]:
-                if "Temperatures" in sensor["Text"]:
-                    for temp_sensor in sensor["Children"]:
-                        if self.__temp_source[device.name] in temp_sensor["Text"]:
-                            device.model = hardware["Text"]
-                            device.temp = float(temp_sensor["Value"].replace(" °C", ""))
-                            return True
+    def __find_temp(self, hardware: dict[str, Any], device: DeviceInfo) -> bool:
+        """Find device temperature sensor in given hardware, stopping at the first match."""
+        if not self.__patterns[device.name].search(hardware["Text"]):
+            return False
+        metric: str = self.__temp_source[device.name]
+        for sensor in hardware["Children"]:
+            if "Temperatures" not in sensor["Text"]:
+                continue
+            for temp_sensor in sensor["Children"]:
+                if metric in temp_sensor["Text"]:
+                    device.model = hardware["Text"]
+                    device.temp = float(temp_sensor["Value"].split(" ", 1)[0])
+                    return True
         return False
 
     def __update_temp(self) -> None:
         """Get CPU Core Average and GPU temperature from LibreHardwareMonitor server."""
-        is_cpu_set: bool = False
-        is_gpu_set: bool = False
         data: dict[str, Any] = self.__get_info_from_server()
-        for hw in data.get("Children", [{}])[0].get("Children", []):
-            if is_cpu_set and is_gpu_set:
+        hardware_list: list[dict[str, Any]] = data.get("Children", [{}])[0].get("Children", [])
+        pending: list[DeviceInfo] = []
+        for device in (self.__cpu, self.__gpu):
+            index: int = self.__hardware_index.get(device.name, -1)
+            if not 0 <= index < len(hardware_list)\
+                or not self.__find_temp(hardware_list[index], device):
+                pending.append(device)
+        for index, hardware in enumerate(hardware_list):
+            if not pending:
                 break
-            if not is_cpu_set:
-                is_cpu_set = self.__parse_info(hw)
-            if not is_gpu_set:
-                is_gpu_set = self.__parse_info(hw, is_cpu=False)
+            for device in pending:
+                if self.__find_temp(hardware, device):
+                    self.__hardware_index[device.name] = index
+                    pending.remove(device)
+                    break
 
     @override
     def quit(self) -> None:
@@ -132,22 +151,31 @@ class Worker(QThread):
         while self.__run:
             self.__update_temp()
             self.new_info.emit(self.__cpu, self.__gpu)
-            self.msleep(self.__config.rate)
+            self.msleep(int(self.__config.rate))
+        self.__session.close()
 
 class MainWindow(QMainWindow):
     """Main Window."""
 
+    __minimized_message: tuple[str, str, QSystemTrayIcon.MessageIcon, int] = (
+        "Minimized to Tray",
+        "Your app is still running in the background.",
+        QSystemTrayIcon.MessageIcon.Information,
+        3000,
+    )
+
     def __init__(self, app_name: str, theme_manager: ThemeManager) -> None:
         """INIT."""
         super().__init__()
         self.__app_name: str = app_name
         self.__settings: str = "settings.json"
+        self.__was_minimized: bool = False
         AppConfig.set("theme", "dark")
         AppConfig.set("start_minimized", False)
         AppConfig.set("minimize_on_exit", False)
         self.__theme_manager: ThemeManager = theme_manager
         self.__sources: ObservableDict = ObservableDict()
-        self.__curves: dict[str, dict[str, list[FanCurvePoint]]] = {}
+        self.__curves: dict[tuple[str, str], list[FanCurvePoint]] = {}
         self.__server_config: ServerConfiguration = ServerConfiguration()
         screen_size: QRect = QGuiApplication.primaryScreen().availableGeometry()
         self.setWindowTitle(self.__app_name)
@@ -171,7 +199,8 @@ class MainWindow(QMainWindow):
         self.__load_settings()
         self.__theme_manager.apply_theme(AppConfig.get("theme"))
         self.__worker: Worker = Worker(self.__server_config, self.__temp_source, self.__min_temp)
-        self.__worker.new_info.connect(self.__update_device_info)
+        self.__worker.new_info.connect(self.__update_device_info,
+                                       Qt.ConnectionType.QueuedConnection)
         self.__worker.start()
         self.__tray_icon: QSystemTrayIcon
         self.__device_manager: DeviceManager = DeviceManager(self.__server_config)
@@ -192,15 +221,12 @@ class MainWindow(QMainWindow):
                                              settings: bool=False) -> dict[str, Any]:
         """Export current configuration."""
         devices: dict[str, Any] = {}
-        sources: dict[str, Any] = self.__sources.get_data()
-        for device_id, channels in sources.items():
-            devices[device_id] = {}
-            for channel, source in channels.items():
-                points: list[FanCurvePoint] = self.__curves.get(device_id, {}).get(channel, [])
-                devices[device_id][channel] = {
-                    "curve": FanCurve.convert_points_to_str(points),
-                    "source": source,
-                }
+        for (device_id, channel), source in self.__sources.get_data().items():
+            points: list[FanCurvePoint] = self.__curves.get((device_id, channel), [])
+            devices.setdefault(device_id, {})[channel] = {
+                "curve": FanCurve.convert_points_to_str(points),
+                "source": source,
+            }
         configuration: dict[str, Any] = {
             "devices": devices,
         }
@@ -217,8 +243,7 @@ class MainWindow(QMainWindow):
                                                       value_type=str if config == "theme" else bool)
         configuration["date"] = str(datetime.now())
         if filename:
-            with open(filename, "w") as f:
-                json.dump(configuration, f, indent=4)
+            utils.write_json(filename, configuration)
         return configuration
 
     def __load_configuration(self, filename: str) -> None:
@@ -227,20 +252,19 @@ class MainWindow(QMainWindow):
         message: str = "Current configuration successfully imported."
         icon: QSystemTrayIcon.MessageIcon = QSystemTrayIcon.MessageIcon.Information
         try:
-            with open(filename) as f:
-                configuration = json.load(f)
+            with open(filename, "rb") as f:
+                configuration = utils.load_json(f.read())
         except Exception as _:
             message = f"Failed to import '{filename}' configuration.\nPlease choose valid file."
             icon = QSystemTrayIcon.MessageIcon.Critical
+        sources: dict[tuple[str, str], str] = {}
+        curves: dict[tuple[str, str], list[FanCurvePoint]] = {}
         for device_id, channels in configuration.get("devices", {}).items():
-            configuration[device_id] = {}
-            sources: dict[str, Any] = {}
-            curves: dict[str, list[FanCurvePoint]] = {}
             for channel, channel_info in channels.items():
-                sources[channel] = channel_info["source"]
-                curves[channel] = FanCurve.convert_str_to_points(channel_info["curve"])
-            self.__sources[device_id] = sources
-            self.__curves[device_id] = curves
+                sources[(device_id, channel)] = channel_info["source"]
+                curves[(device_id, channel)] = FanCurve.convert_str_to_points(channel_info["curve"])
+        self.__sources.update_many(sources)
+        self.__curves.update(curves)
         if filename != self.__settings:
             GLOBAL_SIGNALS.imported.emit()
             self.__tray_icon.showMessage("Import Configuration", message, icon, 3000)
@@ -251,8 +275,8 @@ class MainWindow(QMainWindow):
             return
         self.__load_configuration(self.__settings)
         settings: dict[str, Any] = {}
-        with open(self.__settings) as f:
-            settings = json.load(f)
+        with open(self.__settings, "rb") as f:
+            settings = utils.load_json(f.read())
         AppConfig.set("start_minimized", settings.get("start_minimized", False))
         AppConfig.set("minimize_on_exit", settings.get("minimize_on_exit", False))
         AppConfig.set("start_at_logon", settings.get("start_at_logon", False))
@@ -275,8 +299,7 @@ class MainWindow(QMainWindow):
         if QMessageBox.StandardButton.Yes == reply:
             self.__export_current_configuration(settings=True)
             self.__worker.quit()
-            while self.__worker.isRunning():
-                time.sleep(1)
+            self.__worker.wait()
             QApplication.quit()
 
     def __restore_window(self) -> None:
@@ -291,14 +314,20 @@ class MainWindow(QMainWindow):
 
     def __update_device_info(self, cpu: DeviceInfo, gpu: DeviceInfo) -> None:
         """Update device information."""
+        self.__names.update_many({
+            "CPU": cpu.model,
+            "GPU": gpu.model,
+        })
         cpu_temp: float = cpu.temp
         gpu_temp: float = gpu.temp
-        self.__temps["CPU"] = cpu_temp
-        self.__temps["GPU"] = gpu_temp
-        self.__temps["AVG"] = (cpu_temp + gpu_temp) / 2
-        self.__temps["MAX"] = max(cpu_temp, gpu_temp)
-        self.__names["CPU"] = cpu.model
-        self.__names["GPU"] = gpu.model
+        if cpu_temp == self.__temps["CPU"] and gpu_temp == self.__temps["GPU"]:
+            return
+        self.__temps.update_many({
+            "CPU": cpu_temp,
+            "GPU": gpu_temp,
+            "AVG": (cpu_temp + gpu_temp) / 2,
+            "MAX": max(cpu_temp, gpu_temp),
+        })
 
     def __create_system_tray(self) -> None:
         """Create and setup system tray icon."""
@@ -326,7 +355,8 @@ class MainWindow(QMainWindow):
         device_widget: DeviceSection = DeviceSection(devices, self.__sources, self.__temps,
                                                      self.__curves)
         self.__curves = device_widget.curves
-        list_widget.currentRowChanged.connect(device_widget.update_layout)
+        list_widget.currentRowChanged.connect(device_widget.update_layout,
+                                              Qt.ConnectionType.DirectConnection)
         list_widget.setCurrentRow(0)
         main_layout.addLayout(left_layout, stretch=0)
         main_layout.addWidget(utils.create_separator())
@@ -341,10 +371,17 @@ class MainWindow(QMainWindow):
         """Create central widget."""
         central_widget: QWidget = QWidget()
         central_widget.setAutoFillBackground(True)
-        central_widget.setProperty("id", "central")
-        utils.force_refresh(central_widget)
+        central_widget.setObjectName("central")
+        central_widget.setUpdatesEnabled(False)
         self.__configure_layouts(central_widget)
         self.setCentralWidget(central_widget)
+        central_widget.setUpdatesEnabled(True)
+        central_widget.updateGeometry()
+
+    def __notify_minimized(self) -> None:
+        """Notify that app was minimized to system tray."""
+        if QSystemTrayIcon.isSystemTrayAvailable() and self.__tray_icon.supportsMessages():
+            self.__tray_icon.showMessage(*self.__minimized_message)
 
     @override
     def closeEvent(self, a0: QCloseEvent|None) -> None:
@@ -355,23 +392,17 @@ class MainWindow(QMainWindow):
             self.__close()
             return
         QTimer.singleShot(0, self.hide)
-        self.__tray_icon.showMessage(
-            "Minimized to Tray",
-            "Your app is still running in the background.",
-            QSystemTrayIcon.MessageIcon.Information,
-            3000,
-        )
+        self.__notify_minimized()
 
     @override
     def changeEvent(self, event: QEvent) -> None:
         """Override the change event to handle application minimize to system tray."""
-        if event and event.type() == QEvent.Type.WindowStateChange\
-            and self.windowState() & Qt.WindowState.WindowMinimized:
-            QTimer.singleShot(0, self.hide)
-            self.__tray_icon.showMessage("Minimized to Tray",
-                                         "App is still running in the background.",
-                                         QSystemTrayIcon.MessageIcon.Information,
-                                         3000)
+        if event and event.type() == QEvent.Type.WindowStateChange:
+            is_minimized: bool = bool(self.windowState() & Qt.WindowState.WindowMinimized)
+            if is_minimized and not self.__was_minimized:
+                QTimer.singleShot(0, self.hide)
+                self.__notify_minimized()
+            self.__was_minimized = is_minimized
         super().changeEvent(event)
 
 def main() -> int:
@@ -2,11 +2,11 @@
 
 from typing import Any
 
-import src.utils.common as utils
 from liquidctl.driver import smart_device
-from PySide6.QtCore import Slot
+from PySide6.QtCore import QStringListModel, Qt, QTimer, Slot
 from PySide6.QtWidgets import QHBoxLayout, QVBoxLayout, QWidget
 from src.utils.observable_dict import ObservableDict
+from src.utils.signals import GLOBAL_SIGNALS
 from src.widgets.curve import FanCurve, FanCurvePoint
 
 
@@ -15,42 +15,117 @@ class DeviceSection(QHBoxLayout):
 
     def __init__(self, devices: list[smart_device.SmartDevice2], sources: ObservableDict,
                        temps: ObservableDict,
-                       curves: dict[str, dict[str, list[FanCurvePoint]]]) -> None:
+                       curves: dict[tuple[str, str], list[FanCurvePoint]]) -> None:
         """INIT."""
         super().__init__()
         self.__devices: list[smart_device.SmartDevice2] = devices
         self.__sources: ObservableDict = sources
         self.__temps: ObservableDict = temps
-        self.__curves: dict[str, dict[str, list[FanCurvePoint]]] = curves
+        self.__source_model: QStringListModel = QStringListModel([*temps.keys()], self)
+        self.__curves: dict[tuple[str, str], list[FanCurvePoint]] = curves
+        self.__current: int = -1
+        self.__fan_curves: dict[tuple[str, str], FanCurve] = {}
+        self.__import_pending: bool = False
+        self.__changed_temps: set[str] = set()
+        self.__pending_rpms: dict[tuple[str, str], int] = {}
+        self.__refresh_timer: QTimer = QTimer(self)
+        self.__refresh_timer.setSingleShot(True)
+        self.__refresh_timer.setInterval(150)
+        self.__refresh_timer.timeout.connect(self.__refresh_fan_curves,
+                                             Qt.ConnectionType.DirectConnection)
         self.__construct_layout()
+        GLOBAL_SIGNALS.imported.connect(self.__on_imported, Qt.ConnectionType.DirectConnection)
+        GLOBAL_SIGNALS.update_rpm.connect(self.__on_rpm_updated, Qt.ConnectionType.QueuedConnection)
+        self.__temps.value_changed.connect(self.__on_temps_changed,
+                                           Qt.ConnectionType.DirectConnection)
 
     @property
-    def curves(self) -> dict[str, dict[str, list[FanCurvePoint]]]:
+    def curves(self) -> dict[tuple[str, str], list[FanCurvePoint]]:
         """Return current fan curves."""
         return self.__curves
 
-    def __create_device_layout(self, device: Any, device_id: str) -> QWidget:
-        """Create Device Layout."""
-        widget: QWidget = QWidget()
-        widget.setVisible(False)
-        layout: QVBoxLayout = QVBoxLayout(widget)
-        channels: list[str] = list(device._speed_channels.keys()) #noqa :SLF001
-        for channel in channels:
-            layout.addWidget(FanCurve(self.__temps, self.__sources, device_id, channel,
-                                      points=self.__curves.get(device_id, {}).get(channel, None),
-                                      parent=self.parentWidget()))
-            if channel != channels[-1]:
-                layout.addWidget(utils.create_separator(horizontal=True))
-        return widget
+    def __create_device_layout(self, device: Any, device_id: str, widget: QWidget) -> None:
+        """Create Device Layout, install it on the widget once fully populated."""
+        layout: QVBoxLayout = QVBoxLayout()
+        for index, channel in enumerate(device._speed_channels): #noqa :SLF001
+            points: list[FanCurvePoint]|None = self.__curves.get((device_id, channel))
+            fan_curve: FanCurve = FanCurve(self.__temps, self.__sources, device_id, channel,
+                                           points=points,
+                                           source_model=self.__source_model,
+                                           parent=widget)
+            fan_curve.setAttribute(Qt.WidgetAttribute.WA_LayoutUsesWidgetRect, True)
+            if index:
+                fan_curve.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+                fan_curve.setProperty("separated", True)
+                fan_curve.setContentsMargins(0, 5, 0, 0)
+            layout.addWidget(fan_curve)
+            self.__fan_curves[(device_id, channel)] = fan_curve
+        widget.setLayout(layout)
+
+    @Slot(object)
+    def __on_temps_changed(self, keys: tuple[str, ...]) -> None:
+        """Collect changed temperatures, refresh fan curves once per debounce interval."""
+        self.__changed_temps.update(keys)
+        if not self.__refresh_timer.isActive():
+            self.__refresh_timer.start()
+
+    @Slot()
+    def __refresh_fan_curves(self) -> None:
+        """Update fan curves following collected temperature changes."""
+        keys: tuple[str, ...] = tuple(self.__changed_temps)
+        self.__changed_temps.clear()
+        temps: dict[str, float] = self.__temps.get_data()
+        for fan_curve in self.__fan_curves.values():
+            fan_curve.update_temperature_line(keys, temps)
+
+    @Slot(int, str, int)
+    def __on_rpm_updated(self, device_id: int, channel: str, value: int) -> None:
+        """Collect fan rpm report, keep only the latest one per channel until next flush."""
+        if not self.__pending_rpms:
+            QTimer.singleShot(0, self.__flush_rpms)
+        self.__pending_rpms[(str(device_id), channel)] = value
+
+    def __flush_rpms(self) -> None:
+        """Forward collected fan rpm reports to their fan curves."""
+        pending: dict[tuple[str, str], int] = self.__pending_rpms
+        self.__pending_rpms = {}
+        for key, value in pending.items():
+            fan_curve: FanCurve|None = self.__fan_curves.get(key)
+            if fan_curve is not None:
+                fan_curve.update_rpm(value)
+
+    @Slot()
+    def __on_imported(self) -> None:
+        """Schedule single refresh of all fan curves after configuration import."""
+        if self.__import_pending:
+            return
+        self.__import_pending = True
+        QTimer.singleShot(0, self.__apply_imported)
+
+    def __apply_imported(self) -> None:
+        """Apply imported sources and curves to fan curves."""
+        self.__import_pending = False
+        sources: dict[tuple[str, str], str] = self.__sources.get_data()
+        for key, fan_curve in self.__fan_curves.items():
+            fan_curve.apply_configuration(sources.get(key) or "", self.__curves.get(key, []))
 
     def __construct_layout(self) -> None:
         """Construct main layout."""
         for device_id, device in enumerate(self.__devices):
-            widget: QWidget = self.__create_device_layout(device, str(device_id))
+            widget: QWidget = QWidget()
+            widget.setAttribute(Qt.WidgetAttribute.WA_LayoutUsesWidgetRect, True)
+            widget.setVisible(False)
+            self.__create_device_layout(device, str(device_id), widget)
             self.addWidget(widget)
 
     @Slot(int)
     def update_layout(self, received_device_id: int) -> None:
-        """Construct layout."""
-        for device_id in range(self.count()):
-            self.itemAt(device_id).widget().setVisible(received_device_id == device_id)
+        """Show selected device layout, hide previously shown one."""
+        if received_device_id == self.__current:
+            return
+        if 0 <= self.__current:
+            self.itemAt(self.__current).widget().setVisible(False)
+        self.__current = -1
+        if 0 <= received_device_id < len(self.__devices):
+            self.itemAt(received_device_id).widget().setVisible(True)
+            self.__current = received_device_id
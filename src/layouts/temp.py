@@ -1,7 +1,9 @@
 """Temperature Section."""
 
+from functools import partial
+
 import src.utils.common as utils
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QSignalBlocker, Qt, Slot
 from PySide6.QtWidgets import QComboBox, QHBoxLayout, QLabel, QVBoxLayout
 from src.utils.observable_dict import ObservableDict
 
@@ -14,18 +16,44 @@ class TemperatureSection(QHBoxLayout):
         """INIT."""
         super().__init__()
         self.__temp_source: dict[str, str] = temp_source
+        self.__temps: ObservableDict = temps
+        self.__names: ObservableDict = names
+        self.__temp_labels: dict[str, QLabel] = {}
+        self.__name_labels: dict[str, QLabel] = {}
         sources: list[str] = ["CPU", "GPU"]
-        for source in sources:
-            self.addLayout(self.__create_temp_layout(source, temps, names))
-            if source != sources[-1]:
+        for index, source in enumerate(sources):
+            if index:
                 self.addWidget(utils.create_separator())
+            self.addLayout(self.__create_temp_layout(source))
+        temps.value_changed.connect(self.__update_temp_labels, Qt.ConnectionType.DirectConnection)
+        names.value_changed.connect(self.__update_name_labels, Qt.ConnectionType.DirectConnection)
 
     @staticmethod
-    def __update_temp_label(temps: dict[str, float], source: str, label: QLabel) -> None:
-        """Update temperature label."""
-        new_temp: float = temps.get(source, 0)
-        label.setText(f"{new_temp} C")
-        label.setStyleSheet(f"color: hsl({100 - new_temp}, 100%, 50%);")
+    def __temp_bucket(temperature: float) -> int:
+        """Map temperature to its 10 degree color bucket used by the stylesheet."""
+        return min(9, max(0, int(temperature) // 10 - 2))
+
+    @Slot(object)
+    def __update_temp_labels(self, keys: tuple[str, ...]) -> None:
+        """Update temperature labels of changed sources."""
+        for source in keys:
+            label: QLabel|None = self.__temp_labels.get(source)
+            if label is None:
+                continue
+            new_temp: float = self.__temps[source]
+            label.setText(f"{new_temp} C")
+            bucket: int = self.__temp_bucket(new_temp)
+            if label.property("temp_bucket") != bucket:
+                label.setProperty("temp_bucket", bucket)
+                utils.force_refresh(label)
+
+    @Slot(object)
+    def __update_name_labels(self, keys: tuple[str, ...]) -> None:
+        """Update device name labels of changed sources."""
+        for source in keys:
+            label: QLabel|None = self.__name_labels.get(source)
+            if label is not None:
+                label.setText(self.__names[source])
 
     def __update_temp_source(self, source: str, new_source: str) -> None:
         """Update temperature source."""
@@ -37,8 +65,7 @@ class TemperatureSection(QHBoxLayout):
             new_source = f"{source} {new_source}"
         self.__temp_source[source] = new_source
 
-    def __create_temp_layout(self, source: str, temps: ObservableDict,
-                                   names: ObservableDict) -> QVBoxLayout:
+    def __create_temp_layout(self, source: str) -> QVBoxLayout:
         """Create Temp layout."""
         temp_layout: QVBoxLayout = QVBoxLayout()
         source_label: QLabel = utils.create_label(source, size="large", target="source")
@@ -47,14 +74,15 @@ class TemperatureSection(QHBoxLayout):
         if "GPU" == source:
             sources = ["Core", "Hot Spot"]
         source_box.addItems(sources)
-        source_box.currentTextChanged.connect(lambda new_source: self.__update_temp_source(source,
-                                                                                        new_source))
-        source_box.setCurrentText(" ".join(self.__temp_source[source].split(" ")[1:]))
+        source_box.currentTextChanged.connect(partial(self.__update_temp_source, source),
+                                              Qt.ConnectionType.DirectConnection)
+        with QSignalBlocker(source_box):
+            source_box.setCurrentText(" ".join(self.__temp_source[source].split(" ")[1:]))
         name_label: QLabel = utils.create_label("N/A", size="small", target="source")
-        temp_label: QLabel = utils.create_label(f"{temps[source]} C", size="medium")
-        temps.value_changed.connect(lambda temps: self.__update_temp_label(temps, source,
-                                                                           temp_label))
-        names.value_changed.connect(lambda names: name_label.setText(names.get(source, "N/A")))
+        temp_label: QLabel = utils.create_label(f"{self.__temps[source]} C", size="medium")
+        temp_label.setProperty("temp_bucket", self.__temp_bucket(self.__temps[source]))
+        self.__temp_labels[source] = temp_label
+        self.__name_labels[source] = name_label
         temp_layout.addWidget(source_label, alignment=Qt.AlignmentFlag.AlignCenter)
         temp_layout.addWidget(name_label, alignment=Qt.AlignmentFlag.AlignCenter)
         temp_layout.addWidget(temp_label, alignment=Qt.AlignmentFlag.AlignCenter)
@@ -2,19 +2,43 @@
 
 import os
 from enum import StrEnum
+from typing import Any
 
-from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor, QFont, QIcon, QPainter, QPixmap
 from PySide6.QtWidgets import (
     QFrame,
-    QHBoxLayout,
     QLabel,
-    QSizePolicy,
-    QSpacerItem,
-    QVBoxLayout,
+    QStyle,
     QWidget,
 )
 
+try:
+    import orjson
+
+    def load_json(data: bytes|str) -> Any:
+        """Deserialize JSON document."""
+        return orjson.loads(data)
+
+    def dump_json(data: Any) -> bytes:
+        """Serialize data to indented JSON document."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def load_json(data: bytes|str) -> Any:
+        """Deserialize JSON document."""
+        return json.loads(data)
+
+    def dump_json(data: Any) -> bytes:
+        """Serialize data to indented JSON document."""
+        return json.dumps(data, indent=2).encode()
+
+def write_json(filename: str, data: Any) -> None:
+    """Write data as JSON document, replacing target file atomically."""
+    temporary: str = f"{filename}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(dump_json(data))
+    os.replace(temporary, filename)
 
 class PathManager(StrEnum):
     """Path Manager class."""
@@ -23,6 +47,13 @@ class PathManager(StrEnum):
     ICONS = os.path.join(SOURCE, "icons")
     PRESETS = os.path.join(SOURCE, "presets")
 
+FONT_SIZES: dict[str, int] = {
+    "small": 10,
+    "medium": 30,
+    "large": 50,
+}
+_FONTS: dict[str, QFont] = {}
+
 def create_separator(horizontal: bool=False) -> QFrame:
     """Create separator."""
     separator: QFrame = QFrame()
@@ -33,24 +64,24 @@ def create_separator(horizontal: bool=False) -> QFrame:
 
 def force_refresh(widget: QWidget) -> None:
     """Force refresh widget style."""
-    widget.style().unpolish(widget)
-    widget.style().polish(widget)
+    style: QStyle = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
     widget.update()
 
 def create_label(text: str, size: str="", target: str="") -> QLabel:
     """Create QLabel with dynamic QSS."""
-    size_map: dict[str, int] = {
-        "small": 10,
-        "medium": 30,
-        "large": 50 ,
-    }
+    if size not in FONT_SIZES:
+        size = "small"
     label: QLabel = QLabel(text)
-    font: QFont = label.font()
-    font.setPointSize(size_map.get(size, size_map["small"]))
+    font: QFont|None = _FONTS.get(size)
+    if font is None:
+        font = label.font()
+        font.setPointSize(FONT_SIZES[size])
+        _FONTS[size] = font
     label.setFont(font)
     if target:
         label.setProperty("for", target)
-    force_refresh(label)
     return label
 
 def create_icon(name: str, theme: str) -> QIcon:
@@ -66,26 +97,3 @@ def create_icon(name: str, theme: str) -> QIcon:
         painter.fillRect(pixmap.rect(), QColor("white" if "dark" in theme  else "black"))
         painter.end()
     return QIcon(pixmap)
-
-def create_ruler(min_val: int=0, max_val: int=100, step: int=10, left: bool=True) -> QVBoxLayout:
-    """Create ruler."""
-    layout: QVBoxLayout = QVBoxLayout()
-    layout.setSpacing(0)
-    layout.setContentsMargins(0, 0, 0, 0)
-    values: list[int] = list(reversed(range(min_val, max_val + 1, step)))
-    for i, value in enumerate(values):
-        step_layout: QHBoxLayout = QHBoxLayout()
-        label = QLabel(str(value))
-        alignment: Qt.AlignmentFlag = Qt.AlignmentFlag.AlignVCenter
-        alignment |= Qt.AlignmentFlag.AlignLeft if left else Qt.AlignmentFlag.AlignRight
-        if left:
-            step_layout.addWidget(label, alignment=alignment)
-            step_layout.addWidget(create_separator(horizontal=True))
-        else:
-            step_layout.addWidget(create_separator(horizontal=True))
-            step_layout.addWidget(label, alignment=alignment)
-        if i and i < len(values):
-            layout.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Policy.Minimum,
-                                             QSizePolicy.Policy.Expanding))
-        layout.addLayout(step_layout)
-    return layout
@@ -1,15 +1,29 @@
 """NZXT Device manager."""
 
 import atexit
-from dataclasses import dataclass
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import override
 
 from liquidctl.driver import find_liquidctl_devices
 from liquidctl.driver.smart_device import SmartDevice2
-from PySide6.QtCore import QThread, Slot
+from PySide6.QtCore import QMutex, QMutexLocker, Qt, QThread, QTimer, Signal, Slot
 from src.utils.signals import GLOBAL_SIGNALS
 from src.widgets.settings_dialog import ServerConfiguration
 
+NZXT_VENDOR_ID: int = 0x1E71
+MAX_STATUS_INTERVAL: int = 8
+
+def is_nzxt_device(device: SmartDevice2) -> bool:
+    """Check if not yet connected device is made by NZXT."""
+    return NZXT_VENDOR_ID == getattr(device, "vendor_id", None) or "NZXT" in device.description
+
+def find_nzxt_devices() -> tuple[SmartDevice2, ...]:
+    """Enumerate NZXT devices."""
+    return tuple(device for device in find_liquidctl_devices(vendor=NZXT_VENDOR_ID)
+                 if is_nzxt_device(device))
 
 @dataclass
 class DeviceChannel:
@@ -17,6 +31,7 @@ class DeviceChannel:
 
     speed: int
     rpm: int
+    pushed: int = -1
 
 @dataclass
 class DeviceInformation:
@@ -24,73 +39,173 @@ class DeviceInformation:
 
     device: SmartDevice2
     channels: dict[str, DeviceChannel]
+    report_channels: dict[str, str|None] = field(default_factory=dict)
+    backoff: float = .0
+    retry_at: float = .0
+    status_interval: int = 1
+    status_countdown: int = 0
 
 class Worker(QThread):
     """Get device RPM information."""
 
+    connected: Signal = Signal(bool)
+
     def __init__(self, devices: list[SmartDevice2],
                        server_configuration: ServerConfiguration) -> None:
         """Initialize device RPM information gatherer."""
         super().__init__()
         self.__server_configuration: ServerConfiguration = server_configuration
         self.__devices: dict[int, DeviceInformation] = {}
-        self.__number_of_devices: int = 0
+        self.__pending_speeds: dict[tuple[int, str], int] = {}
+        self.__pending_speeds_mutex: QMutex = QMutex()
         self.__convert_devices_to_dictionary(devices)
-        GLOBAL_SIGNALS.update_speed.connect(self.__update_fan_speed_information)
+        GLOBAL_SIGNALS.update_speed.connect(self.__update_fan_speed_information,
+                                            Qt.ConnectionType.DirectConnection)
 
     def __convert_devices_to_dictionary(self, devices: list[SmartDevice2]) -> None:
         """Convert list of devices to usable dictionary."""
         for device_id, device in enumerate(devices):
-            channels: list[str] = list(device._speed_channels.keys()) #noqa: SLF001
             information: DeviceInformation = DeviceInformation(device=device, channels={})
-            for channel in channels:
-                information.channels[channel] = DeviceChannel(speed=0, rpm=0)
-                self.__number_of_devices += 1
+            for channel in device._speed_channels: #noqa: SLF001
+                information.channels[channel] = DeviceChannel(speed=0, rpm=-1)
             self.__devices[device_id] = information
 
     @Slot(int, str, int)
     def __update_fan_speed_information(self, device_id: int, channel: str, value: int) -> None:
-        """Update new fan speed information for later processing."""
-        if device_id not in self.__devices:
-            return
-        device_information: DeviceInformation = self.__devices[device_id]
-        if channel not in device_information.channels:
-            return
-        device_information.channels[channel].speed = value
+        """Store new fan speed from GUI thread, the worker thread applies it on its next pass."""
+        with QMutexLocker(self.__pending_speeds_mutex):
+            self.__pending_speeds[(device_id, channel)] = value
+
+    def __apply_pending_speeds(self) -> None:
+        """Move fan speeds stored by GUI thread to device channels."""
+        with QMutexLocker(self.__pending_speeds_mutex):
+            pending: dict[tuple[int, str], int] = self.__pending_speeds
+            self.__pending_speeds = {}
+        for (device_id, channel), value in pending.items():
+            device_information: DeviceInformation|None = self.__devices.get(device_id)
+            if device_information is None or channel not in device_information.channels:
+                continue
+            device_information.channels[channel].speed = value
+
+    @staticmethod
+    def __get_report_channel(device_information: DeviceInformation, name: str) -> str|None:
+        """Map status report name, e.g. 'Fan 1 speed', to its channel, parsing each name once."""
+        report_channels: dict[str, str|None] = device_information.report_channels
+        if name not in report_channels:
+            channel: str = "".join(name.split(" ")[:2]).lower()
+            report_channels[name] = channel if channel in device_information.channels else None
+        return report_channels[name]
 
     def __update_rpm_information(self, device_id: int,
-                                       device_information: DeviceInformation) -> None:
-        """Update new fan speed information for later processing."""
+                                       device_information: DeviceInformation) -> bool:
+        """Update new fan speed information for later processing, False if device failed."""
         reports: list[tuple] = []
         try:
             reports = device_information.device.get_status(max_attempts=6)
         except Exception as _:
-            return
+            return False
+        changed: bool = False
         for report in reports:
             if "rpm" in report[-1]:
-                channel: str = "".join(report[0].split(" ")[:2]).lower()
+                channel: str|None = self.__get_report_channel(device_information, report[0])
+                if channel is None:
+                    continue
                 rpm: int = report[1]
-                device_information.channels[channel].rpm = rpm
+                information: DeviceChannel = device_information.channels[channel]
+                if rpm == information.rpm:
+                    continue
+                information.rpm = rpm
+                changed = True
                 GLOBAL_SIGNALS.update_rpm.emit(device_id, channel, rpm)
+        self.__schedule_status(device_information, changed)
+        return True
+
+    @staticmethod
+    def __schedule_status(device_information: DeviceInformation, changed: bool) -> None:
+        """Poll status every update while RPMs move, double the interval while they are steady."""
+        interval: int = 1
+        if not changed:
+            interval = min(MAX_STATUS_INTERVAL, device_information.status_interval * 2)
+        device_information.status_interval = interval
+        device_information.status_countdown = interval - 1
+
+    def __back_off(self, device_information: DeviceInformation) -> None:
+        """Postpone status reads of failing device, doubling the delay up to 32 update periods."""
+        rate: float = int(self.__server_configuration.rate) / 1000
+        device_information.backoff = min(rate * 32, max(rate, device_information.backoff * 2))
+        device_information.retry_at = time.monotonic() + device_information.backoff
 
     def __update_fan_speed(self, device_information: DeviceInformation) -> None:
-        """Update fan speed of given device and channel."""
+        """Push fan speed of given device channels which changed since the last push."""
         device: SmartDevice2 = device_information.device
         channels: dict[str, DeviceChannel] = device_information.channels
         for channel, information in channels.items():
+            speed: int = information.speed
+            if speed == information.pushed:
+                continue
             try:
-                device.set_fixed_speed(channel, information.speed)
-                self.msleep(self.__server_configuration.rate // self.__number_of_devices)
-            except IndexError:
+                device.set_fixed_speed(channel, speed)
+                information.pushed = speed
+                self.__schedule_status(device_information, True)
+            except (IndexError, OSError):
                 ...
 
+    @staticmethod
+    def __connect_device(device: SmartDevice2) -> bool:
+        """Connect and initialize single device."""
+        try:
+            device.connect()
+            device.initialize()
+        except Exception:
+            return False
+        return True
+
+    def __connect_devices(self) -> bool:
+        """Connect all devices in parallel, stop serving the ones that failed."""
+        devices: list[SmartDevice2] = [info.device for info in self.__devices.values()]
+        with ThreadPoolExecutor(max_workers=min(8, len(devices))) as executor:
+            results: list[bool] = list(executor.map(self.__connect_device, devices))
+        for device_id, connected in zip(list(self.__devices), results, strict=True):
+            if not connected:
+                del self.__devices[device_id]
+        return all(results)
+
     @override
     def run(self) -> None:
         """Override thread body."""
-        while True:
-            for device_id, device_information in self.__devices.items():
-                self.__update_rpm_information(device_id, device_information)
-                self.__update_fan_speed(device_information)
+        self.connected.emit(self.__connect_devices())
+        if not self.__devices:
+            return
+        timer: QTimer = QTimer()
+        timer.setInterval(int(self.__server_configuration.rate))
+        timer.timeout.connect(functools.partial(self.__update_devices, timer),
+                              Qt.ConnectionType.DirectConnection)
+        self.__update_devices(timer)
+        timer.start()
+        self.exec()
+        timer.stop()
+
+    def __update_device(self, device_id: int, device_information: DeviceInformation,
+                              now: float) -> None:
+        """Read RPMs unless backing off, always push changed fan speeds of single device."""
+        if now >= device_information.retry_at:
+            if device_information.status_countdown:
+                device_information.status_countdown -= 1
+            elif self.__update_rpm_information(device_id, device_information):
+                device_information.backoff = .0
+            else:
+                self.__back_off(device_information)
+        self.__update_fan_speed(device_information)
+
+    def __update_devices(self, timer: QTimer) -> None:
+        """Update all devices, follow update rate changes."""
+        self.__apply_pending_speeds()
+        now: float = time.monotonic()
+        for device_id, device_information in self.__devices.items():
+            self.__update_device(device_id, device_information, now)
+        rate: int = int(self.__server_configuration.rate)
+        if rate != timer.interval():
+            timer.setInterval(rate)
 
 class DeviceManager:
     """NZXT Controllers manager."""
@@ -100,13 +215,13 @@ class DeviceManager:
         self.__error: bool = False
         self.__devices: list[SmartDevice2] = []
         self.__scan_devices()
-        self.__connect_devices()
         atexit.register(self.__disconnect_devices)
         if not self.__devices:
             return
         self.__worker: Worker = Worker(self.__devices, server_configuration)
+        self.__worker.connected.connect(self.__on_connected)
         self.__worker.start()
-        atexit.register(self.__worker.terminate)
+        atexit.register(self.__stop_worker)
 
     @property
     def error(self) -> bool:
@@ -115,30 +230,30 @@ class DeviceManager:
 
     @property
     def devices(self) -> list[SmartDevice2]:
-        """Return initialized devices."""
+        """Return detected devices, they are connected by the worker thread."""
         return self.__devices
 
     def __scan_devices(self) -> None:
         """Scan available devices."""
-        potential_devices: list[SmartDevice2] = list(find_liquidctl_devices())
-        for device in potential_devices:
-            if "NZXT" not in device.description:
-                continue
-            self.__devices.append(device)
+        self.__devices.extend(find_nzxt_devices())
 
-    def __connect_devices(self) -> None:
-        """Connect all devices."""
-        try:
-            for device in self.__devices:
-                device.connect()
-                device.initialize()
-        except Exception:
-            self.__error = True
+    def __stop_worker(self) -> None:
+        """Stop worker event loop and wait for the running pass to finish."""
+        self.__worker.quit()
+        if not self.__worker.wait(3_000):
+            self.__worker.terminate()
+
+    def __on_connected(self, success: bool) -> None:
+        """Store devices connection status."""
+        self.__error = not success
 
     def __disconnect_devices(self) -> None:
         """Disconnect devices."""
         for device in self.__devices:
-            device.disconnect()
+            try:
+                device.disconnect()
+            except Exception:
+                ...
 
 if "__main__" == __name__:
     ...
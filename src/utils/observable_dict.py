@@ -1,29 +1,33 @@
 """Custom observable dictionary."""
 
+from collections.abc import Hashable, Iterator, KeysView
+from contextlib import contextmanager
 from typing import Any
 
 from PySide6.QtCore import QObject, Signal
 
 
 class ObservableDict(QObject):
-    """Custom Dict with onChange signal."""
+    """Custom Dict with onChange signal carrying changed keys."""
 
-    value_changed: Signal = Signal(dict)
+    value_changed: Signal = Signal(object)
 
     def __init__(self, initial: dict|None=None):
         """INIT."""
         super().__init__()
-        self.__data: dict[str, Any] = initial or {}
+        self.__data: dict[Hashable, Any] = initial or {}
+        self.__bulk_depth: int = 0
+        self.__pending: dict[Hashable, None] = {}
 
-    def __getitem__(self, key: str) -> Any:
+    def __getitem__(self, key: Hashable) -> Any:
         """Get item from dict."""
         return self.__data.get(key, None)
 
-    def __setitem__(self, key: str, value: Any) -> None:
+    def __setitem__(self, key: Hashable, value: Any) -> None:
         """Set value under given key in dict."""
         self.update(key, value)
 
-    def __contains__(self, key: str) -> bool:
+    def __contains__(self, key: Hashable) -> bool:
         """Check if given key exists in dict."""
         return key in self.__data
 
@@ -31,12 +35,40 @@ class ObservableDict(QObject):
         """Print dict representation."""
         return repr(self.__data)
 
-    def update(self, key: str, value: Any) -> None:
-        """Update dict value under given key."""
+    def update(self, key: Hashable, value: Any) -> None:
+        """Update dict value under given key, emit only if it was changed."""
+        if key in self.__data and self.__data[key] == value:
+            return
         self.__data[key] = value
-        self.value_changed.emit(self.__data.copy())
+        if self.__bulk_depth:
+            self.__pending[key] = None
+        else:
+            self.value_changed.emit((key,))
 
-    def get_data(self) -> dict[str, Any]:
+    def update_many(self, items: dict[Hashable, Any]) -> None:
+        """Update several values at once, emit single change signal if any was changed."""
+        with self.bulk_update():
+            for key, value in items.items():
+                self.update(key, value)
+
+    @contextmanager
+    def bulk_update(self) -> Iterator[None]:
+        """Collect changes made inside the block, emit them with single signal on exit."""
+        self.__bulk_depth += 1
+        try:
+            yield
+        finally:
+            self.__bulk_depth -= 1
+            if not self.__bulk_depth and self.__pending:
+                keys: tuple[Hashable, ...] = tuple(self.__pending)
+                self.__pending.clear()
+                self.value_changed.emit(keys)
+
+    def keys(self) -> KeysView[Hashable]:
+        """Get live view of dict keys."""
+        return self.__data.keys()
+
+    def get_data(self) -> dict[Hashable, Any]:
         """Get whole dict."""
         return self.__data.copy()
 
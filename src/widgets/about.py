@@ -1,5 +1,7 @@
 """About Popup."""
 
+from functools import partial
+
 import src.utils.common as utils
 from PySide6.QtCore import Qt, QUrl
 from PySide6.QtGui import QDesktopServices, QIcon
@@ -26,6 +28,11 @@ class AboutPopup(QDialog):
         """Create themed QIcon."""
         return utils.create_icon(name, AppConfig.get("theme"))
 
+    @staticmethod
+    def __open_url(url: QUrl, _checked: bool=False) -> None:
+        """Open given url in default browser."""
+        QDesktopServices.openUrl(url)
+
     def __construct_icon(self) -> QLabel:
         """Construct Icon section."""
         icon_label: QLabel = QLabel()
@@ -66,14 +73,14 @@ class AboutPopup(QDialog):
         """Construct Changelog button."""
         changelog_url: str = f"{self.__git}/commits/master/"
         changelog_button: QPushButton = QPushButton("View Changelog")
-        changelog_button.clicked.connect(lambda: QDesktopServices.openUrl(QUrl(changelog_url)))
+        changelog_button.clicked.connect(partial(self.__open_url, QUrl(changelog_url)))
         return changelog_button
 
     def __construct_contributors(self) -> QPushButton:
         """Construct Contributors button."""
         contributors_url: str = f"{self.__git}/graphs/contributors"
         contributors_button: QPushButton = QPushButton("Contributors")
-        contributors_button.clicked.connect(lambda:QDesktopServices.openUrl(QUrl(contributors_url)))
+        contributors_button.clicked.connect(partial(self.__open_url, QUrl(contributors_url)))
         return contributors_button
 
     def __construct_links(self) -> QHBoxLayout:
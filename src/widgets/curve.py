@@ -1,10 +1,21 @@
 """Fan-curve widget."""
 
+from array import array
 from dataclasses import dataclass
 from typing import override
 
 import src.utils.common as utils
-from PySide6.QtCore import QPointF, QRect, QRectF, QSize, Qt, Signal, Slot
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QPointF,
+    QRect,
+    QRectF,
+    QSignalBlocker,
+    QSize,
+    Qt,
+    Signal,
+    Slot,
+)
 from PySide6.QtGui import QColor, QGuiApplication, QIcon, QMouseEvent, QPainter, QPaintEvent, QPen
 from PySide6.QtWidgets import (
     QComboBox,
@@ -18,7 +29,6 @@ from PySide6.QtWidgets import (
 )
 from src.utils.observable_dict import ObservableDict
 from src.utils.signals import GLOBAL_SIGNALS
-from typing_extensions import Any
 
 
 @dataclass(order=True, frozen=False)
@@ -37,6 +47,8 @@ class FanCurvePoint:
 class FanCurveWidget(QWidget):
     """Interactive fan-curve widget."""
 
+    points_changed: Signal = Signal()
+
     def __init__(self, points: list[FanCurvePoint]|None=None, parent: QWidget|None=None) -> None:
         """Initialize Fan Curve widget."""
         super().__init__(parent)
@@ -78,6 +90,11 @@ class FanCurveWidget(QWidget):
         """Return fan curve points."""
         return self.__points.copy()
 
+    @property
+    def temperature_range(self) -> tuple[float, float]:
+        """Return temperature axis range."""
+        return self.__t_min, self.__t_max
+
     @Slot(list)
     def set_points(self, points: list[FanCurvePoint]) -> None:
         """Set curve points; clamps to ranges and keeps them sorted."""
@@ -89,11 +106,14 @@ class FanCurveWidget(QWidget):
         clamped.sort(key=lambda p: p.temperature)
         self.__points = clamped
         self.update()
+        self.points_changed.emit()
 
     @Slot(FanCurvePoint)
     def update_temperature(self, point: FanCurvePoint) -> None:
-        """Update current temperature."""
+        """Update current temperature, repaint only if the clamped point moved."""
         point.clamp(self.__t_min, self.__t_max, self.__p_min, self.__p_max)
+        if point == self.__t:
+            return
         self.__t = point
         self.update()
 
@@ -104,12 +124,14 @@ class FanCurveWidget(QWidget):
         self.__points.append(point)
         self.__points.sort(key=lambda p: p.temperature)
         self.update()
+        self.points_changed.emit()
 
     def __remove_point_at_index(self, index: int) -> None:
         """Remove point by index; safe no-op if index invalid."""
         if 0 <= index < len(self.__points):
             self.__points.pop(index)
             self.update()
+            self.points_changed.emit()
 
     def __to_screen(self, rect: QRectF, point: FanCurvePoint) -> QPointF:
         """Map domain point to screen coordinates."""
@@ -190,22 +212,22 @@ class FanCurveWidget(QWidget):
         painter.drawEllipse(center, self.__point_radius, self.__point_radius)
         return center
 
-    def __draw_text_above_point(self, painter: QPainter, rect: QRectF, label: QLabel,
+    def __draw_text_above_point(self, painter: QPainter, rect: QRectF, text: str,
                                       center: QPointF, color: QColor) -> None:
         """Draw text above given point."""
         painter.setPen(QPen(color, 1))
-        label_width: int = label.fontMetrics().boundingRect(label.text()).width()
+        text_width: int = painter.fontMetrics().boundingRect(text).width()
         x: int = int(center.x() + self.__point_radius + 2)
         y: int = int(center.y() - self.__point_radius - 2)
-        painter.drawText(min(x, int(rect.width() - (label_width / 2))), y, label.text())
+        painter.drawText(min(x, int(rect.width() - (text_width / 2))), y, text)
 
     def __draw_temperature_lines(self, painter: QPainter, rect: QRectF) -> None:
         """Draw temperature lines."""
         painter.save()
-        label: QLabel = QLabel(f"[T: {self.__t.temperature}, P: {self.__t.percent}]")
+        text: str = f"[T: {self.__t.temperature}, P: {self.__t.percent}]"
         color: QColor = QColor.fromHsl(int(100 - self.__t.temperature), 255, 125)
         center: QPointF = self.__draw_filled_point(painter, rect, self.__t, color)
-        self.__draw_text_above_point(painter, rect, label, center, color)
+        self.__draw_text_above_point(painter, rect, text, center, color)
         painter.restore()
 
     def __draw_points(self, painter: QPainter, rect: QRectF) -> None:
@@ -213,8 +235,8 @@ class FanCurveWidget(QWidget):
         painter.save()
         for index, point in enumerate(self.__points, start=1):
             center: QPointF = self.__draw_filled_point(painter, rect, point, self.__point_fill)
-            label: QLabel = QLabel(f"{index} [T: {point.temperature}, P: {point.percent}]")
-            self.__draw_text_above_point(painter, rect, label, center, self.__axis)
+            text: str = f"{index} [T: {point.temperature}, P: {point.percent}]"
+            self.__draw_text_above_point(painter, rect, text, center, self.__axis)
         painter.restore()
 
     def __draw_labels(self, painter: QPainter, rect: QRectF) -> None:
@@ -281,38 +303,49 @@ class FanCurveWidget(QWidget):
     @override
     def mouseReleaseEvent(self, _event: QMouseEvent) -> None:
         """Override mouse release event."""
+        if self.__drag_index is not None:
+            self.points_changed.emit()
         self.__drag_index = None
 
 class FanCurve(QWidget):
     """Fan curve dialog."""
 
-    __update_points: Signal = Signal(list)
-    __update_temperature: Signal = Signal(FanCurvePoint)
     __point_separator: str = ","
     __list_separator: str = "|"
+    __icons: dict[str, QIcon] = {}
 
     def __init__(self, temps: ObservableDict, sources: ObservableDict,
                        device_id: str, channel: str, points: list[FanCurvePoint]|None=None,
+                       source_model: QAbstractItemModel|None=None,
                        parent: QWidget|None=None) -> None:
         """Initialize fan curve dialog."""
         super().__init__(parent)
         self.__device_id: str = device_id
+        self.__device_index: int = int(device_id)
         self.__channel: str = channel
+        self.__key: tuple[str, str] = (device_id, channel)
+        self.__source: str = ""
         self.__temps: ObservableDict = temps
+        self.__source_model: QAbstractItemModel|None = source_model
         self.__sources: ObservableDict = sources
         self.__rpm_label: QLabel = utils.create_label("RPM: N/A")
+        self.__source_box: QComboBox = QComboBox()
         self.__widget: FanCurveWidget = FanCurveWidget(points=points, parent=self)
-        self.__update_points.connect(self.__widget.set_points)
-        self.__update_temperature.connect(self.__widget.update_temperature)
-        self.__temps.value_changed.connect(self.__update_temperature_line)
+        self.__speed_offset: int = 0
+        self.__speed_table: array[int] = array("B")
+        self.__speed: int = -1
+        self.__rpm: int = -1
+        self.__build_speed_table()
+        self.__widget.points_changed.connect(self.__on_points_changed,
+                                             Qt.ConnectionType.DirectConnection)
         self.__construct_layout()
-        GLOBAL_SIGNALS.update_rpm.connect(self.__update_fan_rpm)
 
-    @Slot(int, str, int)
-    def __update_fan_rpm(self, device_id: int, channel: str, value: int) -> None:
-        """Update fan rpm report."""
-        if str(device_id) == self.__device_id and channel == self.__channel:
-            self.__rpm_label.setText(f"RPM: {value}")
+    def update_rpm(self, value: int) -> None:
+        """Update fan rpm report, skip if label already shows given value."""
+        if value == self.__rpm:
+            return
+        self.__rpm = value
+        self.__rpm_label.setText(f"RPM: {value}")
 
     @property
     def points(self) -> list[FanCurvePoint]:
@@ -363,16 +396,44 @@ class FanCurve(QWidget):
             return []
         return points
 
-    def __update_temperature_line(self) -> None:
-        """Update temperature line."""
-        device_sources: dict[str, Any] = self.__sources[self.__device_id]
-        if not device_sources:
+    def apply_configuration(self, source: str, points: list[FanCurvePoint]) -> None:
+        """Apply imported source and curve points, skipping unchanged ones."""
+        source_changed: bool = bool(source) and source != self.__source_box.currentText()
+        if source_changed:
+            self.__source = source
+            with QSignalBlocker(self.__source_box):
+                self.__source_box.setCurrentText(source)
+        if points and points != self.__widget.points:
+            self.__widget.set_points(points)
+        elif source_changed:
+            self.update_temperature_line()
+
+    def __build_speed_table(self) -> None:
+        """Precompute fan speed for every whole degree of the temperature range."""
+        t_min, t_max = self.__widget.temperature_range
+        points: list[FanCurvePoint] = sorted(self.__widget.points, key=lambda p: p.temperature)
+        self.__speed_offset = int(t_min)
+        self.__speed_table = array("B", (round(self.evaluate(points, temperature))
+                                         for temperature in range(int(t_min), int(t_max) + 1)))
+
+    def __on_points_changed(self) -> None:
+        """Rebuild speed table after curve points change."""
+        self.__build_speed_table()
+        self.update_temperature_line()
+
+    def update_temperature_line(self, changed: tuple[str, ...]|None=None,
+                                temps: dict[str, float]|None=None) -> None:
+        """Update temperature line and fan speed, skip if source is not among changed ones."""
+        source: str = self.__source
+        if not source or (changed is not None and source not in changed):
             return
-        source: str = device_sources.get(self.__channel, "")
-        temperature: float = self.__temps[source]
-        speed: float = self.evaluate(self.__widget.points, temperature)
-        GLOBAL_SIGNALS.update_speed.emit(int(self.__device_id), self.__channel, int(speed))
-        self.__update_temperature.emit(FanCurvePoint(temperature=temperature, percent=speed))
+        temperature: float = self.__temps[source] if temps is None else temps[source]
+        table: array[int] = self.__speed_table
+        speed: int = table[max(0, min(len(table) - 1, round(temperature) - self.__speed_offset))]
+        if speed != self.__speed:
+            self.__speed = speed
+            GLOBAL_SIGNALS.update_speed.emit(self.__device_index, self.__channel, speed)
+        self.__widget.update_temperature(FanCurvePoint(temperature=temperature, percent=speed))
 
     def __copy_on_click(self) -> None:
         """Copy current curve to clipboard."""
@@ -380,43 +441,54 @@ class FanCurve(QWidget):
 
     def __paste_on_click(self) -> None:
         """Paste clipboard curve information."""
-        self.__update_points.emit(self.convert_str_to_points(QGuiApplication.clipboard().text()))
+        self.__widget.set_points(self.convert_str_to_points(QGuiApplication.clipboard().text()))
 
     def __update_fan_source(self, source: str) -> None:
         """Update fan temperature source."""
-        sources: dict[str, Any] = self.__sources.get_data()
-        if self.__device_id not in sources:
-            sources[self.__device_id] = {}
-        if self.__channel not in sources[self.__device_id]:
-            sources[self.__device_id][self.__channel] = {}
-        sources[self.__device_id][self.__channel] = source
-        self.__sources[self.__device_id] = sources[self.__device_id]
+        self.__source = source
+        if self.__sources[self.__key] == source:
+            return
+        self.__sources[self.__key] = source
+        self.update_temperature_line()
 
     def __construct_source_layout(self) -> QGridLayout:
         """Create fan settings layout."""
         layout: QGridLayout = QGridLayout()
-        source_box: QComboBox = QComboBox()
+        source_box: QComboBox = self.__source_box
         source_box.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        source_box.addItems([*self.__temps.get_data().keys()])
-        source_box.currentTextChanged.connect(self.__update_fan_source)
+        if self.__source_model is None:
+            source_box.addItems([*self.__temps.keys()])
+        else:
+            source_box.setModel(self.__source_model)
+        source_box.currentTextChanged.connect(self.__update_fan_source,
+                                              Qt.ConnectionType.DirectConnection)
         current_text: str = source_box.currentText()
-        if self.__device_id in self.__sources\
-            and self.__channel in self.__sources[self.__device_id]:
-            current_text = self.__sources[self.__device_id][self.__channel]
-            source_box.setCurrentText(current_text)
+        if self.__key in self.__sources:
+            current_text = self.__sources[self.__key]
+            with QSignalBlocker(source_box):
+                source_box.setCurrentText(current_text)
         layout.addWidget(utils.create_label(self.__channel, target="channel"), 0, 0,
                                             alignment=Qt.AlignmentFlag.AlignLeft)
         layout.addWidget(source_box, 0, 1, alignment=Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.__rpm_label, 0, 2, alignment=Qt.AlignmentFlag.AlignRight)
-        self.__update_fan_source(current_text)
+        self.__source = current_text
+        self.__sources[self.__key] = current_text
+        self.update_temperature_line()
         return layout
 
+    @classmethod
+    def __theme_icon(cls, name: str) -> QIcon:
+        """Return theme icon shared between all fan curves."""
+        if name not in cls.__icons:
+            cls.__icons[name] = QIcon.fromTheme(name)
+        return cls.__icons[name]
+
     def __construct_buttons_layout(self) -> QHBoxLayout:
         """Construct buttons layout."""
         layout: QHBoxLayout = QHBoxLayout()
         layout.setContentsMargins(0, 5, 0, 5)
-        copy_button: QPushButton = QPushButton(QIcon.fromTheme("edit-copy"), "Copy")
-        paste_button: QPushButton = QPushButton(QIcon.fromTheme("edit-paste"), "Paste")
+        copy_button: QPushButton = QPushButton(self.__theme_icon("edit-copy"), "Copy")
+        paste_button: QPushButton = QPushButton(self.__theme_icon("edit-paste"), "Paste")
         copy_button.clicked.connect(self.__copy_on_click)
         paste_button.clicked.connect(self.__paste_on_click)
         layout.addWidget(copy_button, alignment=Qt.AlignmentFlag.AlignCenter)
@@ -1,6 +1,7 @@
 """MenuBar of app."""
 
 from collections.abc import Callable
+from functools import partial
 
 import src.utils.common as utils
 from PySide6.QtCore import QEvent
@@ -55,7 +56,7 @@ class MenuBar(QMenuBar):
         self.__load(filename)
 
     def __on_network_triggered(self, server_config: ServerConfiguration,
-                                     theme_manager: ThemeManager) -> None:
+                                     theme_manager: ThemeManager, _checked: bool=False) -> None:
         """On Source Configuration triggered."""
         dialog: SettingsDialog = SettingsDialog(server_config, theme_manager, self.__export, self)
         dialog.exec()
@@ -73,8 +74,8 @@ class MenuBar(QMenuBar):
                                      theme_manager: ThemeManager) -> None:
         """Create settings menu."""
         network_action: QAction = self.addAction(self.__create_icon("settings"), "&Settings")
-        network_action.triggered.connect(lambda _: self.__on_network_triggered(server_config,
-                                                                               theme_manager))
+        network_action.triggered.connect(partial(self.__on_network_triggered, server_config,
+                                                 theme_manager))
 
     def __on_about_triggered(self) -> None:
         """On Source Configuration triggered."""
@@ -4,7 +4,7 @@ import os
 import sys
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, override
 
 import src.utils.common as utils
 import win32com.client
@@ -25,6 +25,9 @@ from src.widgets.config import AppConfig
 from src.widgets.theme_manager import ThemeManager
 from win32com.client.dynamic import CDispatch
 
+PORT_REGEX: QRegularExpression = QRegularExpression(
+    r"^(6553[0-5]|655[0-2]\d|65[0-4]\d{2}|6[0-4]\d{3}|[1-5]\d{4}|\d{1,4})$",
+)
 
 @dataclass
 class ServerConfiguration:
@@ -34,6 +37,18 @@ class ServerConfiguration:
     port: int = 8085
     rate: float = 1 * 1_000
 
+    @override
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set attribute, rebuild server URL when the address changes."""
+        super().__setattr__(name, value)
+        if name in ("ip", "port"):
+            self.__url = f"http://{self.ip}:{self.port}/data.json"
+
+    @property
+    def url(self) -> str:
+        """LibreHardwareMonitor data URL."""
+        return self.__url
+
 class SettingsDialog(QDialog):
     """Simple Settings selection Dialog."""
 
@@ -127,10 +142,7 @@ class SettingsDialog(QDialog):
         self.__port_input.setText(str(self.__config.port))
         self.__port_input.setPlaceholderText("Enter Port (1–65535)")
         self.__port_input.setPlaceholderText("Enter IP address")
-        port_regex: QRegularExpression = QRegularExpression(
-            r"^(6553[0-5]|655[0-2]\d|65[0-4]\d{2}|6[0-4]\d{3}|[1-5]\d{4}|\d{1,4})$",
-        )
-        self.__port_input.setValidator(QRegularExpressionValidator(port_regex))
+        self.__port_input.setValidator(QRegularExpressionValidator(PORT_REGEX))
         layout.addWidget(self.__port_input, row, 1, 1, 2)
         return row + 1
 